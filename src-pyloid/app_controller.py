@@ -302,7 +302,8 @@ class AppController:
         return {
             "models": self.settings_service.get_available_models(),
             "languages": self.settings_service.get_available_languages(),
-            "retentionOptions": self.settings_service.get_retention_options(),
+            # MappingProxyType isn't JSON serializable, hand RPC a plain dict
+            "retentionOptions": dict(self.settings_service.get_retention_options()),
             "themeOptions": self.settings_service.get_theme_options(),
             "microphones": self.audio_service.get_input_devices(),
             "deviceOptions": self.settings_service.get_device_options(),
@@ -433,7 +434,7 @@ class AppController:
         info("Resetting all user data...")
         self.db.reset_all_data()
         # Reset settings service cache
-        self.settings_service._cache = None
+        self.settings_service.invalidate_cache()
         info("All data has been reset")
 
     def get_history_audio(self, history_id: int) -> dict:
@@ -34,8 +34,8 @@ class AudioService:
         if status:
             log.warning("Audio status warning", status=str(status))
 
-        # Copy audio data
-        audio_chunk = indata.copy().flatten()
+        # Copy audio data (flatten already copies; PortAudio reuses indata)
+        audio_chunk = indata.flatten()
         self._audio_queue.put(audio_chunk)
 
         # Calculate amplitude for visualization using RMS (root mean square)
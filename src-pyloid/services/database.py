@@ -1,10 +1,25 @@
 import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 from services.logger import debug
 
 
+# Stay below SQLite's default host-parameter limit (999) for IN (...) lists
+_MAX_IN_PARAMS = 900
+
+_HISTORY_ENTRY_COLUMNS = """
+                id,
+                text,
+                char_count,
+                word_count,
+                created_at,
+                audio_relpath,
+                audio_duration_ms,
+                audio_size_bytes,
+                audio_mime"""
+
+
 class DatabaseService:
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
@@ -88,6 +103,34 @@ class DatabaseService:
         conn.commit()
         conn.close()
 
+    def get_settings_bulk(self, keys: Sequence[str]) -> dict:
+        """Fetch several settings in one query. Missing keys are omitted."""
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({placeholders})",
+            tuple(keys),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+        return {row["key"]: row["value"] for row in rows}
+
+    def set_settings_bulk(self, items: Sequence[tuple]) -> None:
+        """Write several (key, value) settings in a single transaction."""
+        if not items:
+            return
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            items,
+        )
+        conn.commit()
+        conn.close()
+
     def get_all_settings(self) -> dict:
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -133,6 +176,48 @@ class DatabaseService:
         conn.close()
         return history_id
 
+    def add_history_bulk(self, rows: Sequence[tuple]) -> list:
+        """Insert several history entries in a single transaction.
+
+        Each row holds add_history()'s arguments in order; trailing audio
+        fields may be omitted. Returns the new ids in row order.
+        """
+        if not rows:
+            return []
+        created_at = datetime.now().isoformat()
+        params = []
+        for row in rows:
+            text, audio_relpath, audio_duration_ms, audio_size_bytes, audio_mime = (
+                tuple(row) + (None,) * (5 - len(row))
+            )
+            params.append((
+                text,
+                len(text),
+                len(text.split()),
+                created_at,
+                audio_relpath,
+                audio_duration_ms,
+                audio_size_bytes,
+                audio_mime,
+            ))
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            """INSERT INTO history (
+                   text, char_count, word_count, created_at,
+                   audio_relpath, audio_duration_ms, audio_size_bytes, audio_mime
+               )
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            params,
+        )
+        # The transaction holds the write lock, so the new ids are consecutive
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
+        conn.commit()
+        conn.close()
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
     def update_history_audio(
         self,
         history_id: int,
@@ -209,37 +294,71 @@ class DatabaseService:
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT
-                id,
-                text,
-                char_count,
-                word_count,
-                created_at,
-                audio_relpath,
-                audio_duration_ms,
-                audio_size_bytes,
-                audio_mime
-            FROM history
-            WHERE id = ?
-            """,
+            f"SELECT {_HISTORY_ENTRY_COLUMNS} FROM history WHERE id = ?",
             (history_id,),
         )
         row = cursor.fetchone()
         conn.close()
         return dict(row) if row else None
 
+    def get_history_entries(self, history_ids: Sequence[int]) -> dict:
+        """Fetch several entries by id in one query. Missing ids are omitted."""
+        entries = {}
+        if not history_ids:
+            return entries
+        ids = list(history_ids)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        for start in range(0, len(ids), _MAX_IN_PARAMS):
+            chunk = ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT {_HISTORY_ENTRY_COLUMNS} FROM history WHERE id IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                entries[row["id"]] = dict(row)
+        conn.close()
+        return entries
+
     def delete_history(self, history_id: int):
-        entry = self.get_history_entry(history_id)
+        self.delete_history_bulk([history_id])
 
-        if entry and entry.get("audio_relpath"):
-            self._delete_audio_file(entry["audio_relpath"])
+    def delete_history_bulk(self, history_ids: Sequence[int]) -> int:
+        """Delete several entries and their audio files.
+
+        Rows are removed in one transaction; audio files are deleted only
+        after it commits. Returns the number of rows deleted.
+        """
+        if not history_ids:
+            return 0
+        ids = list(history_ids)
 
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM history WHERE id = ?", (history_id,))
-        conn.commit()
-        conn.close()
+        audio_relpaths = []
+        deleted = 0
+        try:
+            for start in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT audio_relpath FROM history "
+                    f"WHERE id IN ({placeholders}) AND audio_relpath IS NOT NULL",
+                    chunk,
+                )
+                audio_relpaths.extend(row["audio_relpath"] for row in cursor.fetchall())
+                cursor.execute(f"DELETE FROM history WHERE id IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        self._delete_audio_files(audio_relpaths)
+        return deleted
 
     def clear_old_history(self, days: int):
         """Clear history older than specified days. -1 means keep forever."""
@@ -256,9 +375,7 @@ class DatabaseService:
             "SELECT audio_relpath FROM history WHERE created_at < ? AND audio_relpath IS NOT NULL",
             (cutoff,),
         )
-        rows = cursor.fetchall()
-        for row in rows:
-            self._delete_audio_file(row["audio_relpath"])
+        self._delete_audio_files([row["audio_relpath"] for row in cursor.fetchall()])
 
         cursor.execute("DELETE FROM history WHERE created_at < ?", (cutoff,))
         conn.commit()
@@ -348,17 +465,25 @@ class DatabaseService:
 
         return streak
 
-    def _delete_audio_file(self, relpath: str) -> None:
-        """Delete an audio file, ignoring missing files."""
+    def _delete_audio_files(self, relpaths) -> None:
+        """Delete several audio files, resolving the audio root only once.
+
+        Paths outside the audio directory are skipped; missing files are ignored.
+        """
         try:
             data_dir = self.db_path.parent.resolve()
             audio_root = (data_dir / "audio").resolve()
-            path = (data_dir / relpath).resolve()
-            try:
-                path.relative_to(audio_root)
-            except ValueError:
-                return
-            if path.exists():
-                path.unlink()
         except Exception as exc:
-            debug(f"Failed to delete audio file {relpath}: {exc}")
+            debug(f"Failed to resolve audio directory: {exc}")
+            return
+
+        for relpath in relpaths:
+            try:
+                path = (data_dir / relpath).resolve()
+                try:
+                    path.relative_to(audio_root)
+                except ValueError:
+                    continue
+                path.unlink(missing_ok=True)
+            except Exception as exc:
+                debug(f"Failed to delete audio file {relpath}: {exc}")
@@ -19,7 +19,7 @@ DEVICE_OPTIONS = ["auto", "cpu", "cuda"]
 
 # Compute type mappings
 CPU_COMPUTE_TYPE = "int8"
-CUDA_COMPUTE_TYPE = "float16"
+CUDA_COMPUTE_TYPE = "int8_float16"  # int8 weights, fp16 activations
 
 # cuDNN DLLs required for CUDA inference (Windows)
 CUDNN_DLLS = [
@@ -29,6 +29,7 @@ CUDNN_DLLS = [
 
 # Cache for CUDA availability check result
 _cuda_available_cache: Optional[bool] = None
+_cuda_compute_types_cache: Optional[list[str]] = None
 _cudnn_path_added: bool = False
 
 
@@ -171,11 +172,15 @@ def get_cuda_compute_types() -> list[str]:
 
     Returns empty list if CUDA is not available.
     """
-    try:
-        import ctranslate2
-        return list(ctranslate2.get_supported_compute_types("cuda"))
-    except Exception:
-        return []
+    global _cuda_compute_types_cache
+
+    if _cuda_compute_types_cache is None:
+        try:
+            import ctranslate2
+            _cuda_compute_types_cache = list(ctranslate2.get_supported_compute_types("cuda"))
+        except Exception:
+            _cuda_compute_types_cache = []
+    return list(_cuda_compute_types_cache)
 
 
 def get_cpu_compute_types() -> list[str]:
@@ -296,8 +301,8 @@ def get_compute_type(device: str) -> str:
         cuda_types = get_cuda_compute_types()
         if CUDA_COMPUTE_TYPE in cuda_types:
             return CUDA_COMPUTE_TYPE
-        elif "int8_float16" in cuda_types:
-            return "int8_float16"
+        elif "float16" in cuda_types:
+            return "float16"
         elif cuda_types:
             return cuda_types[0]
         else:
@@ -351,8 +356,9 @@ def get_cudnn_status() -> tuple[bool, Optional[str]]:
 
 def reset_cuda_cache():
     """Reset the CUDA availability cache to force re-detection."""
-    global _cuda_available_cache, _cudnn_path_added
+    global _cuda_available_cache, _cuda_compute_types_cache, _cudnn_path_added
     _cuda_available_cache = None
+    _cuda_compute_types_cache = None
     _cudnn_path_added = False
     log.debug("CUDA cache reset")
 
@@ -14,11 +14,17 @@ Usage:
 """
 import logging
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Any
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
 
 # Configuration constants
 LOG_MAX_BYTES = 100 * 1024 * 1024  # 100MB
@@ -35,6 +41,16 @@ _file_handler: Optional[RotatingFileHandler] = None
 _console_handler: Optional[logging.StreamHandler] = None
 
 
+def _dumps(data: dict) -> str:
+    """Serialize structured data to JSON, preferring orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys or ints beyond 64 bits; let json try
+    return json.dumps(data, ensure_ascii=False)
+
+
 def get_default_log_path() -> Path:
     """Get the default log file path."""
     return Path.home() / ".VoiceFlow" / "VoiceFlow.log"
@@ -71,12 +87,49 @@ class HybridFormatter(logging.Formatter):
         # Add structured data if present
         structured_data = getattr(record, 'structured_data', None)
         if structured_data:
-            json_str = json.dumps(structured_data, ensure_ascii=False)
+            json_str = _dumps(structured_data)
             return f"{base} | {json_str}"
 
         return base
 
 
+# Extra bytes per "\n" once a text-mode stream translates it (1 for "\r\n" on Windows)
+_NEWLINE_EXTRA = len(os.linesep) - 1
+
+
+class SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that counts bytes written instead of calling
+    stream.tell() for every record, and formats each record only once.
+
+    The count starts from the file size whenever the file is (re)opened.
+    """
+
+    def _open(self):
+        stream = super()._open()
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            size += msg.count("\n") * _NEWLINE_EXTRA
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class DomainLogger:
     """
     A logger for a specific domain that supports structured data via kwargs.
@@ -90,8 +143,18 @@ class DomainLogger:
         self._domain = domain
         self._logger = logger
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether a message at this level would be emitted.
+
+        Use to skip computing expensive structured data for disabled levels.
+        """
+        return self._logger.isEnabledFor(level)
+
     def _log(self, level: int, message: str, **kwargs):
         """Log a message with optional structured data."""
+        if not self._logger.isEnabledFor(level):
+            return
+
         # Create a LogRecord with structured data
         if kwargs:
             # Store kwargs as structured data
@@ -154,7 +217,7 @@ def setup_logging(
     formatter = HybridFormatter()
 
     # Create file handler with rotation
-    _file_handler = RotatingFileHandler(
+    _file_handler = SizeTrackingRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
@@ -12,13 +12,14 @@ Provides:
 Uses faster_whisper's download_model() which handles HuggingFace Hub internally.
 Cache location: ~/.cache/huggingface/hub/
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
+import functools
 import threading
 import time
 import os
-import io
+import stat
 
 from services.logger import get_logger
 
@@ -74,36 +75,126 @@ MODEL_REPOS = {
 }
 
 
-def _get_repo_id(model_name: str) -> str:
+# Files faster-whisper needs from a model repo (same list faster_whisper.download_model()
+# uses, so WhisperModel finds everything in the cache without fetching more)
+_MODEL_ALLOW_PATTERNS = [
+    "config.json",
+    "preprocessor_config.json",
+    "model.bin",
+    "tokenizer.json",
+    "vocabulary.*",
+]
+
+# Model names in display order, computed once for get_available_models()
+_AVAILABLE_MODELS = tuple(MODEL_SIZES)
+
+
+@functools.lru_cache(maxsize=64)
+def get_repo_id(model_name: str) -> str:
     """Get the HuggingFace repo ID for a model name."""
     return MODEL_REPOS.get(model_name, f"Systran/faster-whisper-{model_name}")
 
 
+def _walk_delete(root: str) -> int:
+    """
+    Delete a directory tree, returning the total size of the files removed.
+
+    Sizes are taken with lstat() during the same bottom-up walk that deletes
+    the files, so each entry is only stat'ed once. Symlinks (HuggingFace
+    snapshots link into blobs/) are removed as links: never followed, and not
+    counted, so each blob's size is reported once.
+    """
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.lstat(path)
+            if stat.S_ISREG(st.st_mode):
+                total += st.st_size
+            os.unlink(path)
+        for name in dirnames:
+            # os.walk doesn't descend into symlinked directories; remove the link itself
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                os.unlink(path)
+        os.rmdir(dirpath)
+    return total
+
+
 @dataclass
 class CancelToken:
-    """Token for cancelling long-running operations."""
-    _cancelled: bool = False
+    """Token for cancelling long-running operations.
+
+    Backed by a threading.Event so the flag is safely visible across threads
+    without relying on the GIL.
+    """
+    _event: threading.Event = field(default_factory=threading.Event, repr=False)
+    # Events to wake when cancel() is called (see _add_waiter)
+    _waiters: list = field(default_factory=list, repr=False)
 
     def cancel(self) -> None:
         """Request cancellation of the operation."""
-        self._cancelled = True
+        self._event.set()
+        for event in list(self._waiters):
+            event.set()
 
     def is_cancelled(self) -> bool:
         """Check if cancellation has been requested."""
-        return self._cancelled
+        return self._event.is_set()
+
+    def _add_waiter(self, event: threading.Event) -> None:
+        """Set event when cancel() is called (immediately if already cancelled)."""
+        self._waiters.append(event)
+        if self._event.is_set():
+            event.set()
+
+    def _remove_waiter(self, event: threading.Event) -> None:
+        """Stop notifying event on cancel()."""
+        try:
+            self._waiters.remove(event)
+        except ValueError:
+            pass
 
 
 @dataclass
 class ModelInfo:
     """Information about a Whisper model."""
+    __slots__ = ("name", "size_bytes", "cached")
     name: str
     size_bytes: int
     cached: bool
 
 
+@dataclass
+class _ProgressState:
+    """Mutable progress shared between the tqdm bars and send_progress()."""
+    __slots__ = (
+        "files_total",
+        "files_done",
+        "bytes_downloaded",
+        "bytes_total",
+        "start_time",
+        "last_update_time",
+    )
+    files_total: int
+    files_done: int
+    bytes_downloaded: int
+    bytes_total: int  # Actual total from tqdm (more accurate than MODEL_SIZES)
+    start_time: float
+    last_update_time: float
+
+
 @dataclass
 class DownloadProgress:
     """Progress information for model downloads."""
+    __slots__ = (
+        "model_name",
+        "percent",
+        "downloaded_bytes",
+        "total_bytes",
+        "speed_bps",
+        "eta_seconds",
+    )
     model_name: str
     percent: float
     downloaded_bytes: int
@@ -112,6 +203,16 @@ class DownloadProgress:
     eta_seconds: float
 
 
+class _NullIO:
+    """Write-only stream that discards everything (tqdm console output sink)."""
+
+    def write(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+
 class ProgressTracker:
     """
     A tqdm-compatible class that tracks download progress.
@@ -130,18 +231,19 @@ class ProgressTracker:
         self.model_name = model_name
         self.on_progress = on_progress
         self.cancel_token = cancel_token
+        self._is_cancelled = cancel_token._event.is_set
         self.total = total
         self.n = 0
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._last_update_time = self._start_time
 
     def update(self, n: int = 1):
         """Update progress by n bytes."""
-        if self.cancel_token.is_cancelled():
+        if self._is_cancelled():
             raise DownloadCancelledError("Download cancelled by user")
 
-        self.n += n
-        now = time.time()
+        self.n = current = self.n + n
+        now = time.monotonic()
 
         # Throttle updates to avoid overwhelming the UI
         if now - self._last_update_time < 0.1:  # Max 10 updates per second
@@ -150,17 +252,17 @@ class ProgressTracker:
         self._last_update_time = now
 
         # Calculate progress
+        total = self.total
         elapsed = now - self._start_time
-        speed = self.n / elapsed if elapsed > 0 else 0
-        remaining = self.total - self.n
-        eta = remaining / speed if speed > 0 else 0
-        percent = (self.n / self.total * 100) if self.total > 0 else 0
+        speed = current / elapsed if elapsed > 0 else 0
+        eta = (total - current) / speed if speed > 0 else 0
+        percent = (current / total * 100) if total > 0 else 0
 
         progress = DownloadProgress(
             model_name=self.model_name,
             percent=percent,
-            downloaded_bytes=self.n,
-            total_bytes=self.total,
+            downloaded_bytes=current,
+            total_bytes=total,
             speed_bps=speed,
             eta_seconds=eta
         )
@@ -196,10 +298,29 @@ class ModelManager:
 
     def __init__(self):
         self._download_lock = threading.Lock()
+        self._cache_root: Optional[Path] = None
+        # Models confirmed complete in the cache; rechecked with a single stat
+        self._known_cached: set = set()
+
+    def get_cache_path(self) -> Path:
+        """
+        Get the HuggingFace hub cache directory models are stored in.
+
+        Resolved once (honoring HF_HOME / HF_HUB_CACHE like snapshot_download).
+        """
+        if self._cache_root is None:
+            from huggingface_hub import constants
+
+            self._cache_root = Path(constants.HF_HUB_CACHE)
+        return self._cache_root
+
+    def _repo_cache_dir(self, model_name: str) -> Path:
+        # e.g., "Systran/faster-whisper-tiny" -> "models--Systran--faster-whisper-tiny"
+        return self.get_cache_path() / f"models--{get_repo_id(model_name).replace('/', '--')}"
 
     def get_available_models(self) -> list:
         """Get list of all supported model names."""
-        return list(MODEL_SIZES.keys())
+        return list(_AVAILABLE_MODELS)
 
     def is_model_cached(self, model_name: str) -> bool:
         """
@@ -214,11 +335,22 @@ class ModelManager:
             True if the model is cached, False otherwise.
         """
         try:
+            # Already verified: only check the repo folder is still there
+            if model_name in self._known_cached:
+                if self._repo_cache_dir(model_name).is_dir():
+                    return True
+                self._known_cached.discard(model_name)
+
             from huggingface_hub import snapshot_download
 
-            repo_id = _get_repo_id(model_name)
+            repo_id = get_repo_id(model_name)
             # Try to get model path with local_files_only - raises if not cached
-            snapshot_download(repo_id, local_files_only=True)
+            snapshot_download(
+                repo_id,
+                local_files_only=True,
+                allow_patterns=_MODEL_ALLOW_PATTERNS,
+            )
+            self._known_cached.add(model_name)
             return True
         except Exception:
             # Model not found in cache
@@ -278,6 +410,8 @@ class ModelManager:
 
         Uses huggingface_hub.snapshot_download() with progress tracking.
         Runs download in a daemon thread so cancellation can abandon it.
+        Partially downloaded blobs are left as .incomplete files in the cache
+        and huggingface_hub (>=0.23) resumes them with a Range request on retry.
 
         Args:
             model_name: Name of the model to download
@@ -293,44 +427,53 @@ class ModelManager:
         log.info("Starting model download", model=model_name)
 
         # Get the correct repo ID for this model
-        repo_id = _get_repo_id(model_name)
+        repo_id = get_repo_id(model_name)
         log.info("Downloading from repo", repo_id=repo_id)
 
         # Track progress across all files
         total_size = MODEL_SIZES.get(model_name, 0)
-        progress_state = {
-            "files_total": 0,
-            "files_done": 0,
-            "bytes_downloaded": 0,
-            "bytes_total": 0,  # Actual total from tqdm (more accurate than MODEL_SIZES)
-            "start_time": time.time(),
-            "last_update_time": time.time()
-        }
+        start_time = time.monotonic()
+        progress_state = _ProgressState(
+            files_total=0,
+            files_done=0,
+            bytes_downloaded=0,
+            bytes_total=0,
+            start_time=start_time,
+            last_update_time=start_time,
+        )
 
         # Result holder for the download thread
         result = {"success": False, "error": None, "model_path": None}
 
+        # Set by the download thread when it exits; wake is also set on cancel
+        finished = threading.Event()
+        wake = threading.Event()
+
         def send_progress():
             """Send progress update to callback."""
-            now = time.time()
+            ps = progress_state
+            now = time.monotonic()
             # Throttle updates to max 10 per second
-            if now - progress_state["last_update_time"] < 0.1:
+            if now - ps.last_update_time < 0.1:
                 return
-            progress_state["last_update_time"] = now
+            ps.last_update_time = now
 
-            elapsed = now - progress_state["start_time"]
+            elapsed = now - ps.start_time
+            btotal = ps.bytes_total
+            ftotal = ps.files_total
 
             # Prefer actual byte progress over file count progress
             # Byte progress is more accurate since model.bin is most of the download
-            if progress_state["bytes_total"] > 0:
+            if btotal > 0:
                 # Use actual byte progress from tqdm
-                actual_bytes = progress_state["bytes_downloaded"]
-                actual_total = progress_state["bytes_total"]
+                actual_bytes = ps.bytes_downloaded
+                actual_total = btotal
                 percent = (actual_bytes / actual_total) * 100
-            elif progress_state["files_total"] > 0:
+            elif ftotal > 0:
                 # Fall back to file-based progress estimation
-                percent = (progress_state["files_done"] / progress_state["files_total"]) * 100
-                actual_bytes = int((progress_state["files_done"] / progress_state["files_total"]) * total_size)
+                fraction = ps.files_done / ftotal
+                percent = fraction * 100
+                actual_bytes = int(fraction * total_size)
                 actual_total = total_size
             else:
                 percent = 0
@@ -363,13 +506,16 @@ class ModelManager:
                 # CRITICAL: Redirect tqdm output to dummy stream to prevent crash in windowed apps
                 # When packaged with PyInstaller --windowed, sys.stderr is None
                 # which causes "'NoneType' object has no attribute 'write'" error
-                # We track progress via callbacks, so tqdm console output is not needed
-                kwargs['file'] = io.StringIO()
+                # We track progress via callbacks, so tqdm console output is not needed.
+                # Unlike StringIO, _NullIO doesn't retain every rendered bar in memory.
+                # (disable=True is not an option: tqdm then stops tracking self.n)
+                kwargs['file'] = _NullIO()
+                self._is_cancelled = cancel_token._event.is_set
                 super().__init__(*args, **kwargs)
 
             def update(self, n=1):
                 # Check for cancellation - raise exception to abort download
-                if cancel_token.is_cancelled():
+                if self._is_cancelled():
                     raise DownloadCancelledError("Download cancelled by user")
 
                 super().update(n)
@@ -379,16 +525,16 @@ class ModelManager:
 
                 # Track file completion progress (unit='it' for iterations)
                 if unit == 'it' and n > 0:
-                    if progress_state["files_total"] == 0 and total > 0:
-                        progress_state["files_total"] = total
-                    progress_state["files_done"] = current_n
+                    if progress_state.files_total == 0 and total > 0:
+                        progress_state.files_total = total
+                    progress_state.files_done = current_n
                     send_progress()
 
                 # Track byte-based progress from individual file downloads
                 if n > 0 and unit and 'B' in str(unit):
-                    if total > 0 and progress_state["bytes_total"] == 0:
-                        progress_state["bytes_total"] = total
-                    progress_state["bytes_downloaded"] = current_n
+                    if total > 0 and progress_state.bytes_total == 0:
+                        progress_state.bytes_total = total
+                    progress_state.bytes_downloaded = current_n
                     send_progress()
 
         def download_thread():
@@ -406,8 +552,10 @@ class ModelManager:
                 ))
 
                 # Use huggingface_hub directly with our custom tqdm for progress
+                # Skip READMEs, .gitattributes and any other files WhisperModel doesn't load
                 model_path = snapshot_download(
                     repo_id,
+                    allow_patterns=_MODEL_ALLOW_PATTERNS,
                     tqdm_class=DownloadProgressBar,
                 )
                 result["success"] = True
@@ -419,22 +567,30 @@ class ModelManager:
             except Exception as e:
                 log.error("Download thread exception", error=str(e), model=model_name)
                 result["error"] = str(e)
+            finally:
+                finished.set()
+                wake.set()
 
         # Start download in daemon thread
         thread = threading.Thread(target=download_thread, daemon=True)
         thread.start()
 
-        # Wait for completion while checking for cancellation
-        while thread.is_alive():
-            if cancel_token.is_cancelled():
-                log.info("Model download cancelled by user", model=model_name)
-                # Thread is daemon, so it will be abandoned when we return
-                return False
-            thread.join(timeout=0.1)  # Check every 100ms
+        # Block until the download finishes or the user cancels
+        cancel_token._add_waiter(wake)
+        try:
+            wake.wait()
+        finally:
+            cancel_token._remove_waiter(wake)
+
+        if not finished.is_set():
+            log.info("Model download cancelled by user", model=model_name)
+            # Thread is daemon, so it will be abandoned when we return
+            return False
 
         # Check result
         if result["success"]:
             log.info("Model download completed", model=model_name, path=result["model_path"])
+            self._known_cached.add(model_name)
 
             # Send final 100% progress
             on_progress(DownloadProgress(
@@ -469,7 +625,7 @@ class ModelManager:
         from faster_whisper import WhisperModel
 
         # Use repo_id for loading to ensure correct model is loaded
-        repo_id = _get_repo_id(model_name)
+        repo_id = get_repo_id(model_name)
         log.info("Loading model", model=model_name, repo_id=repo_id)
         model = WhisperModel(
             repo_id,
@@ -529,16 +685,15 @@ class ModelManager:
                 - deleted_models: list of model names that were deleted
                 - error: error message if failed
         """
-        import shutil
-
         log.info("Clearing model cache")
 
         deleted_bytes = 0
         deleted_models = []
+        self._known_cached.clear()
 
         try:
             # Get HuggingFace cache directory
-            cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
+            cache_dir = self.get_cache_path()
 
             if not cache_dir.exists():
                 log.info("Cache directory does not exist, nothing to clear")
@@ -549,22 +704,28 @@ class ModelManager:
                     "error": None
                 }
 
-            # Find and delete all faster-whisper model directories
+            # List the cache directory once instead of stat'ing every known repo folder
             # HuggingFace stores models as: models--{org}--{repo}
+            with os.scandir(cache_dir) as entries:
+                present = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name.startswith("models--") and entry.is_dir()
+                }
+
+            # Find and delete all faster-whisper model directories
             for model_name, repo_id in MODEL_REPOS.items():
                 # Convert repo_id to HuggingFace cache folder name
                 # e.g., "Systran/faster-whisper-tiny" -> "models--Systran--faster-whisper-tiny"
                 cache_folder_name = f"models--{repo_id.replace('/', '--')}"
-                model_cache_path = cache_dir / cache_folder_name
+                model_cache_path = present.get(cache_folder_name)
 
-                if model_cache_path.exists():
-                    # Calculate size before deleting
-                    size = sum(f.stat().st_size for f in model_cache_path.rglob("*") if f.is_file())
+                if model_cache_path is not None:
+                    log.info("Deleting model cache", model=model_name, path=model_cache_path)
+                    size = _walk_delete(model_cache_path)
                     deleted_bytes += size
                     deleted_models.append(model_name)
-
-                    log.info("Deleting model cache", model=model_name, path=str(model_cache_path), size_bytes=size)
-                    shutil.rmtree(model_cache_path)
+                    log.info("Deleted model cache", model=model_name, size_bytes=size)
 
             log.info("Model cache cleared",
                      deleted_count=len(deleted_models),
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional
 from .database import DatabaseService
 from .hotkey import normalize_hotkey
 
@@ -36,6 +37,13 @@ THEME_OPTIONS = ["system", "light", "dark"]
 # Device options for transcription
 DEVICE_OPTIONS = ["auto", "cpu", "cuda"]
 
+# Read-only views handed out by SettingsService (built once, safe to share)
+_WHISPER_MODELS_T = tuple(WHISPER_MODELS)
+_WHISPER_LANGUAGES_T = tuple(WHISPER_LANGUAGES)
+_RETENTION_OPTIONS_MP = MappingProxyType(RETENTION_OPTIONS)
+_THEME_OPTIONS_T = tuple(THEME_OPTIONS)
+_DEVICE_OPTIONS_T = tuple(DEVICE_OPTIONS)
+
 
 @dataclass
 class Settings:
@@ -55,31 +63,49 @@ class Settings:
     toggle_hotkey_enabled: bool = False
 
 
+def _parse_bool(value: str) -> bool:
+    return value == "true"
+
+
+# Stored values are strings; parse each field according to its declared type
+_PARSERS = {bool: _parse_bool, int: int, str: str}
+
+# (key, parser, default) for every Settings field, built once at import
+_FIELDS = tuple((f.name, _PARSERS[f.type], f.default) for f in fields(Settings))
+
+# Database keys for every Settings field, fetched together in get_settings()
+_SETTING_KEYS = tuple(name for name, _, _ in _FIELDS)
+
+
+def _serialize_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# Hotkeys are normalized before storing for a consistent format
+_COERCE_OVERRIDES = {"hold_hotkey": normalize_hotkey, "toggle_hotkey": normalize_hotkey}
+_SERIALIZERS = {bool: _serialize_bool, int: str, str: str}
+
+# (key, coerce, serialize) for every Settings field, used by update_settings()
+_UPDATE_FIELDS = tuple(
+    (f.name, _COERCE_OVERRIDES.get(f.name, f.type), _SERIALIZERS[f.type])
+    for f in fields(Settings)
+)
+
+
 class SettingsService:
     def __init__(self, db: DatabaseService):
         self.db = db
         self._cache: Optional[Settings] = None
 
     def get_settings(self) -> Settings:
-        if self._cache:
+        if self._cache is not None:
             return self._cache
 
-        settings = Settings(
-            language=self.db.get_setting("language", "auto"),
-            model=self.db.get_setting("model", "tiny"),
-            device=self.db.get_setting("device", "auto"),
-            auto_start=self.db.get_setting("auto_start", "true") == "true",
-            retention=int(self.db.get_setting("retention", "-1")),
-            theme=self.db.get_setting("theme", "system"),
-            onboarding_complete=self.db.get_setting("onboarding_complete", "false") == "true",
-            microphone=int(self.db.get_setting("microphone", "-1")),
-            save_audio_to_history=self.db.get_setting("save_audio_to_history", "false") == "true",
-            # Hotkey settings
-            hold_hotkey=self.db.get_setting("hold_hotkey", "ctrl+win"),
-            hold_hotkey_enabled=self.db.get_setting("hold_hotkey_enabled", "true") == "true",
-            toggle_hotkey=self.db.get_setting("toggle_hotkey", "ctrl+shift+win"),
-            toggle_hotkey_enabled=self.db.get_setting("toggle_hotkey_enabled", "false") == "true",
-        )
+        rows = self.db.get_settings_bulk(_SETTING_KEYS)
+        settings = Settings(**{
+            name: parse(rows[name]) if name in rows else default
+            for name, parse, default in _FIELDS
+        })
         self._cache = settings
         return settings
 
@@ -100,48 +126,43 @@ class SettingsService:
         toggle_hotkey: Optional[str] = None,
         toggle_hotkey_enabled: Optional[bool] = None,
     ) -> Settings:
-        if language is not None:
-            self.db.set_setting("language", language)
-        if model is not None:
-            self.db.set_setting("model", model)
-        if device is not None:
-            self.db.set_setting("device", device)
-        if auto_start is not None:
-            self.db.set_setting("auto_start", "true" if auto_start else "false")
-        if retention is not None:
-            self.db.set_setting("retention", str(retention))
-        if theme is not None:
-            self.db.set_setting("theme", theme)
-        if onboarding_complete is not None:
-            self.db.set_setting("onboarding_complete", "true" if onboarding_complete else "false")
-        if microphone is not None:
-            self.db.set_setting("microphone", str(microphone))
-        if save_audio_to_history is not None:
-            self.db.set_setting("save_audio_to_history", "true" if save_audio_to_history else "false")
-        # Hotkey settings - normalize before storing for consistent format
-        if hold_hotkey is not None:
-            self.db.set_setting("hold_hotkey", normalize_hotkey(hold_hotkey))
-        if hold_hotkey_enabled is not None:
-            self.db.set_setting("hold_hotkey_enabled", "true" if hold_hotkey_enabled else "false")
-        if toggle_hotkey is not None:
-            self.db.set_setting("toggle_hotkey", normalize_hotkey(toggle_hotkey))
-        if toggle_hotkey_enabled is not None:
-            self.db.set_setting("toggle_hotkey_enabled", "true" if toggle_hotkey_enabled else "false")
-
-        self._cache = None  # Invalidate cache
+        given = locals()
+
+        # Collect typed values first so the cache can be patched in place
+        updates = {}
+        pairs = []
+        for name, coerce, serialize in _UPDATE_FIELDS:
+            value = given[name]
+            if value is not None:
+                value = coerce(value)
+                updates[name] = value
+                pairs.append((name, serialize(value)))
+
+        # One transaction for all changed keys
+        self.db.set_settings_bulk(pairs)
+
+        # Patch the cached settings instead of reloading every key
+        if self._cache is not None:
+            for key, value in updates.items():
+                setattr(self._cache, key, value)
+            return self._cache
         return self.get_settings()
 
-    def get_available_models(self) -> list:
-        return WHISPER_MODELS
+    def invalidate_cache(self) -> None:
+        """Drop cached settings so the next get_settings() reloads from the database."""
+        self._cache = None
+
+    def get_available_models(self) -> tuple[str, ...]:
+        return _WHISPER_MODELS_T
 
-    def get_available_languages(self) -> list:
-        return WHISPER_LANGUAGES
+    def get_available_languages(self) -> tuple[str, ...]:
+        return _WHISPER_LANGUAGES_T
 
-    def get_retention_options(self) -> dict:
-        return RETENTION_OPTIONS
+    def get_retention_options(self) -> Mapping[str, int]:
+        return _RETENTION_OPTIONS_MP
 
-    def get_theme_options(self) -> list:
-        return THEME_OPTIONS
+    def get_theme_options(self) -> tuple[str, ...]:
+        return _THEME_OPTIONS_T
 
-    def get_device_options(self) -> list:
-        return DEVICE_OPTIONS
+    def get_device_options(self) -> tuple[str, ...]:
+        return _DEVICE_OPTIONS_T
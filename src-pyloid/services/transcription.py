@@ -1,82 +1,187 @@
+import os
+import logging
 import numpy as np
-from typing import Optional
-from faster_whisper import WhisperModel
+from typing import Optional, TYPE_CHECKING
 import threading
+from collections import OrderedDict
 from services.logger import get_logger
-from services.model_manager import MODEL_REPOS
+from services.model_manager import get_repo_id
 from services.gpu import resolve_device, get_compute_type
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 log = get_logger("model")
 
+# Scratch buffers hold the float32/normalized copy of the input audio between
+# calls. Sized for Whisper's 30 s window at 16 kHz and grown for longer clips.
+_SCRATCH_MIN_SAMPLES = 30 * 16000
+_SCRATCH_POOL_SIZE = 2
+
+# Loaded models kept around so switching back to a recent one skips the reload
+_MODEL_POOL_SIZE = 2
+
+# Use every core for CPU inference (CTranslate2 otherwise caps itself at 4 threads)
+_CPU_THREADS = os.cpu_count() or 0
+
+# Built once. Must stay a plain dict: faster-whisper only expands dict instances
+# into VadOptions, and WhisperModel.transcribe() does not mutate it.
+_VAD_PARAMETERS = dict(
+    min_silence_duration_ms=500,  # Less aggressive silence detection
+    speech_pad_ms=400,  # More padding around speech
+)
 
-def _get_repo_id(model_name: str) -> str:
-    """Get the HuggingFace repo ID for a model name."""
-    return MODEL_REPOS.get(model_name, f"Systran/faster-whisper-{model_name}")
+# How long transcribe() waits for an in-progress load before giving up
+_MODEL_READY_TIMEOUT = 60.0
+
+# Beam width per (model, device). Small models on CPU decode greedily: beam
+# search multiplies decoder work for little accuracy gain at that size.
+_DEFAULT_BEAM_SIZE = 5
+_BEAM_POLICY = {
+    ("tiny", "cpu"): 1,
+    ("tiny.en", "cpu"): 1,
+    ("base", "cpu"): 1,
+    ("base.en", "cpu"): 1,
+    ("distil-small.en", "cpu"): 1,
+}
 
 
 class TranscriptionService:
     def __init__(self):
-        self._model: Optional[WhisperModel] = None
+        self._model: Optional["WhisperModel"] = None
         self._current_model_name: str = None
         self._current_device: str = None
         self._current_compute_type: str = None
         self._loading = False
+        # _lock guards the published model state and is only held briefly;
+        # _load_lock serializes the slow WhisperModel construction
         self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        # Notified when a load finishes, whether it succeeded or failed
+        self._load_done = threading.Condition(self._lock)
+        self._model_pool: "OrderedDict[tuple, WhisperModel]" = OrderedDict()
+        self._scratch_pool: list = []
+        self._scratch_lock = threading.Lock()
 
     def load_model(self, model_name: str = "tiny", device_preference: str = "auto"):
         """Load or switch Whisper model.
 
+        The previous model stays usable by transcribe() until the new one
+        is ready; the status getters never wait on a load.
+
         Args:
             model_name: Name of the Whisper model
             device_preference: "auto", "cpu", or "cuda"
         """
-        # Resolve device and compute type
+        # Resolve the device on every call: "auto" can change answer while the
+        # app runs (cuDNN installed, CUDA cache reset after a failed load)
         device = resolve_device(device_preference)
+
+        # Fast path: the requested model is already loaded on that device
+        if (self._model is not None
+            and self._current_model_name == model_name
+            and self._current_device == device):
+            return
+
         compute_type = get_compute_type(device)
 
-        with self._lock:
-            # Check if we need to reload
-            if (self._current_model_name == model_name
-                and self._current_device == device
-                and self._model is not None):
-                return  # Already loaded with same config
+        key = (model_name, device, compute_type)
+        with self._load_lock:
+            with self._lock:
+                # Check if we need to reload
+                if (self._current_model_name == model_name
+                    and self._current_device == device
+                    and self._model is not None):
+                    return  # Already loaded with same config
+
+                # Switching back to a recently used model is free
+                pooled = self._model_pool.get(key)
+                if pooled is not None:
+                    self._model_pool.move_to_end(key)
+                    self._set_current(pooled, model_name, device, compute_type)
+                    log.info("Model reused from pool", model=model_name, device=device)
+                    return
+
+                # Make room before constructing, so a full pool plus the new
+                # model never sit in (V)RAM together
+                self._trim_pool(_MODEL_POOL_SIZE - 1)
 
             self._loading = True
+            model = None
             try:
-                repo_id = _get_repo_id(model_name)
-                log.info(
-                    "Loading model",
-                    model=model_name,
-                    device=device,
-                    compute_type=compute_type
-                )
-                self._model = WhisperModel(
+                model, device, compute_type = self._create_model(model_name, device, compute_type)
+            finally:
+                with self._lock:
+                    if model is not None:
+                        self._add_to_pool((model_name, device, compute_type), model)
+                        self._set_current(model, model_name, device, compute_type)
+                    self._loading = False
+                    self._load_done.notify_all()
+
+    def _create_model(self, model_name: str, device: str, compute_type: str) -> tuple:
+        """Construct a WhisperModel, falling back to CPU if CUDA fails.
+
+        Returns (model, device, compute_type) actually used.
+        """
+        # Imported here: faster_whisper pulls in ctranslate2/tokenizers,
+        # which would otherwise slow every app start
+        from faster_whisper import WhisperModel
+
+        repo_id = get_repo_id(model_name)
+        try:
+            log.info(
+                "Loading model",
+                model=model_name,
+                device=device,
+                compute_type=compute_type
+            )
+            model = WhisperModel(
+                repo_id,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=_CPU_THREADS if device == "cpu" else 0,
+            )
+            log.info("Model loaded successfully", device=device, compute_type=compute_type)
+            return model, device, compute_type
+        except Exception as e:
+            log.error("Failed to load model", error=str(e), device=device)
+            # If CUDA failed, try falling back to CPU
+            if device == "cuda":
+                log.warning("CUDA load failed, falling back to CPU")
+                model = WhisperModel(
                     repo_id,
-                    device=device,
-                    compute_type=compute_type,
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=_CPU_THREADS,
                 )
-                self._current_model_name = model_name
-                self._current_device = device
-                self._current_compute_type = compute_type
-                log.info("Model loaded successfully", device=device, compute_type=compute_type)
-            except Exception as e:
-                log.error("Failed to load model", error=str(e), device=device)
-                # If CUDA failed, try falling back to CPU
-                if device == "cuda":
-                    log.warning("CUDA load failed, falling back to CPU")
-                    self._model = WhisperModel(
-                        repo_id,
-                        device="cpu",
-                        compute_type="int8",
-                    )
-                    self._current_model_name = model_name
-                    self._current_device = "cpu"
-                    self._current_compute_type = "int8"
-                    log.info("Model loaded on CPU fallback")
-                else:
-                    raise
-            finally:
-                self._loading = False
+                log.info("Model loaded on CPU fallback")
+                return model, "cpu", "int8"
+            raise
+
+    def _set_current(self, model, model_name: str, device: str, compute_type: str):
+        self._model = model
+        self._current_model_name = model_name
+        self._current_device = device
+        self._current_compute_type = compute_type
+
+    def _add_to_pool(self, key: tuple, model):
+        """Keep model in the LRU pool, evicting the least recently used."""
+        self._model_pool[key] = model
+        self._model_pool.move_to_end(key)
+        self._trim_pool(_MODEL_POOL_SIZE)
+
+    def _trim_pool(self, limit: int):
+        """Evict least recently used models until at most limit remain.
+
+        The current model is never evicted: transcribe() may be using it.
+        """
+        current = (self._current_model_name, self._current_device, self._current_compute_type)
+        for key in list(self._model_pool):
+            if len(self._model_pool) <= limit:
+                break
+            if key != current:
+                del self._model_pool[key]
+                log.info("Model evicted from pool", model=key[0], device=key[1])
 
     def is_loading(self) -> bool:
         return self._loading
@@ -92,55 +197,109 @@ class TranscriptionService:
         """Get the compute type currently being used."""
         return self._current_compute_type or "int8"
 
+    def _borrow_scratch(self, n: int) -> np.ndarray:
+        """Take a float32 buffer of at least n samples from the pool."""
+        with self._scratch_lock:
+            for i, buf in enumerate(self._scratch_pool):
+                if len(buf) >= n:
+                    return self._scratch_pool.pop(i)
+        return np.empty(max(n, _SCRATCH_MIN_SAMPLES), dtype=np.float32)
+
+    def _return_scratch(self, buf: np.ndarray):
+        """Give a buffer back to the pool for the next call."""
+        with self._scratch_lock:
+            if len(self._scratch_pool) < _SCRATCH_POOL_SIZE:
+                self._scratch_pool.append(buf)
+
     def transcribe(
         self,
         audio: np.ndarray,
         language: str = "auto",
     ) -> str:
-        """Transcribe audio to text."""
-        if self._model is None:
+        """Transcribe audio to text.
+
+        AudioService records float32 directly, so recorder output is used
+        as-is; other dtypes are converted into a scratch buffer.
+        """
+        with self._lock:
+            # A model mid-load is waited for rather than treated as missing
+            if self._model is None and self._loading:
+                self._load_done.wait_for(
+                    lambda: self._model is not None or not self._loading,
+                    timeout=_MODEL_READY_TIMEOUT,
+                )
+            # Snapshot the published state so a concurrent switch can't mix models
+            model = self._model
+            beam_size = _BEAM_POLICY.get(
+                (self._current_model_name, self._current_device), _DEFAULT_BEAM_SIZE
+            )
+        if model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
         if len(audio) == 0:
             return ""
 
-        # Ensure audio is float32 and normalized
+        # Ensure audio is float32 and normalized. Converted/normalized copies
+        # go into a pooled scratch buffer rather than a fresh allocation.
+        scratch = None
         if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+            scratch = self._borrow_scratch(len(audio))
+            np.copyto(scratch[:len(audio)], audio, casting="unsafe")
+            audio = scratch[:len(audio)]
 
-        # Normalize if needed
-        max_val = np.abs(audio).max()
-        if max_val > 1.0:
-            audio = audio / max_val
+        # Normalize if needed. The abs copy is only worth making for the debug stats.
+        debug_stats = log.is_enabled_for(logging.DEBUG)
+        if debug_stats:
+            abs_buf = self._borrow_scratch(len(audio))
+            abs_audio = np.abs(audio, out=abs_buf[:len(audio)])
+            max_val = float(abs_audio.max())
+            mean_val = float(abs_audio.mean())
+            del abs_audio
+            self._return_scratch(abs_buf)
+        else:
+            max_val = max(float(audio.max()), -float(audio.min()))
+        scale = max_val if max_val > 1.0 else 1.0
+        if scale != 1.0:
+            if scratch is None:
+                scratch = self._borrow_scratch(len(audio))
+            # In place when audio already lives in the scratch buffer
+            np.divide(audio, scale, out=scratch[:len(audio)])
+            audio = scratch[:len(audio)]
 
         # Transcribe
         language_arg = None if language == "auto" else language
 
-        log.debug("Audio stats", length=len(audio), max_amplitude=float(np.abs(audio).max()), mean_amplitude=float(np.abs(audio).mean()))
-
-        segments, info = self._model.transcribe(
-            audio,
-            language=language_arg,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,  # Less aggressive silence detection
-                speech_pad_ms=400,  # More padding around speech
-            ),
-        )
-
-        # Combine all segments
-        segments_list = list(segments)
-        log.debug("Transcription segments", segment_count=len(segments_list))
-        text_parts = [segment.text for segment in segments_list]
-        text = " ".join(text_parts).strip()
+        if debug_stats:
+            # Stats describe the normalized audio passed to the model
+            log.debug("Audio stats", length=len(audio), max_amplitude=max_val / scale, mean_amplitude=mean_val / scale)
+
+        try:
+            segments, info = model.transcribe(
+                audio,
+                language=language_arg,
+                beam_size=beam_size,
+                vad_filter=True,
+                vad_parameters=_VAD_PARAMETERS,
+            )
+
+            # Combine all segments, keeping only their text as they decode
+            text_parts = [segment.text for segment in segments]
+            log.debug("Transcription segments", segment_count=len(text_parts))
+            text = " ".join(text_parts).strip()
+        finally:
+            # Segments are decoded lazily, so the buffer is only released once consumed
+            if scratch is not None:
+                self._return_scratch(scratch)
 
         return text
 
     def unload_model(self):
         """Unload model to free memory."""
         with self._lock:
+            self._model_pool.clear()
             self._model = None
             self._current_model_name = None
             self._current_device = None
             self._current_compute_type = None
+        with self._scratch_lock:
+            self._scratch_pool.clear()
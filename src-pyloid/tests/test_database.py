@@ -0,0 +1,185 @@
+import pytest
+import shutil
+import sqlite3
+from unittest.mock import patch
+from services.database import DatabaseService
+
+
+@pytest.fixture(scope="module")
+def _shared_db(tmp_path_factory):
+    """One database (schema created once) shared by the tests in this module."""
+    return DatabaseService(tmp_path_factory.mktemp("db") / "test.db")
+
+
+@pytest.fixture
+def db(_shared_db):
+    """Shared test database, emptied after each test."""
+    yield _shared_db
+    conn = sqlite3.connect(_shared_db.db_path)
+    conn.executescript(
+        "DELETE FROM history; DELETE FROM settings; "
+        "DELETE FROM sqlite_sequence WHERE name = 'history';"
+    )
+    conn.close()
+    shutil.rmtree(_shared_db.db_path.parent / "audio", ignore_errors=True)
+
+
+class TestHistoryBulkInsert:
+    def test_add_history_bulk_returns_ids_in_order(self, db):
+        """Bulk insert returns one id per row, matching the stored text."""
+        ids = db.add_history_bulk([(f"Test transcription {i}",) for i in range(5)])
+
+        assert len(ids) == 5
+        entries = db.get_history_entries(ids)
+        assert [entries[history_id]["text"] for history_id in ids] == [
+            f"Test transcription {i}" for i in range(5)
+        ]
+
+    def test_add_history_bulk_counts_and_audio_fields(self, db):
+        """Bulk insert computes counts and stores optional audio metadata."""
+        (history_id,) = db.add_history_bulk([
+            ("hello there world", "audio/a.wav", 1200, 4096, "audio/wav"),
+        ])
+        entry = db.get_history_entry(history_id)
+
+        assert entry["char_count"] == len("hello there world")
+        assert entry["word_count"] == 3
+        assert entry["audio_relpath"] == "audio/a.wav"
+        assert entry["audio_duration_ms"] == 1200
+        assert entry["audio_mime"] == "audio/wav"
+
+    def test_add_history_bulk_continues_after_single_inserts(self, db):
+        """Ids from a bulk insert follow ids handed out by add_history()."""
+        first = db.add_history("First")
+        ids = db.add_history_bulk([("Second",), ("Third",)])
+
+        assert ids == [first + 1, first + 2]
+
+    def test_add_history_bulk_empty(self, db):
+        """An empty batch inserts nothing."""
+        assert db.add_history_bulk([]) == []
+        assert db.get_history() == []
+
+
+class TestHistoryLookup:
+    def test_get_history_entries_omits_missing_ids(self, db):
+        """Only existing ids are returned, keyed by id."""
+        ids = db.add_history_bulk([("one",), ("two",), ("three",)])
+        db.delete_history(ids[1])
+
+        entries = db.get_history_entries([ids[0], ids[1], ids[2], 9999])
+
+        assert set(entries) == {ids[0], ids[2]}
+        assert entries[ids[2]] == db.get_history_entry(ids[2])
+
+    def test_get_history_entries_large_id_list(self, db):
+        """Id lists longer than SQLite's parameter limit are split into chunks."""
+        ids = db.add_history_bulk([(f"entry {i}",) for i in range(1000)])
+
+        assert set(db.get_history_entries(ids)) == set(ids)
+
+    def test_get_history_entries_empty(self, db):
+        assert db.get_history_entries([]) == {}
+
+
+class TestHistoryBulkDelete:
+    @pytest.mark.parametrize(
+        "audio_names, delete_indexes, extra_ids",
+        [
+            pytest.param([None] * 5, [0, 2, 4], [], id="text_only"),
+            pytest.param(["a", "b", "c"], [0, 1], [], id="with_audio"),
+            pytest.param(["a", None, "c", None], [0, 1, 2], [], id="mixed_audio"),
+            pytest.param([None, "b"], [], [], id="empty_list"),
+            pytest.param(["a", None], [0], [9998, 9999], id="invalid_ids"),
+        ],
+    )
+    def test_delete_history_bulk(self, db, audio_names, delete_indexes, extra_ids):
+        """Selected rows and their audio files are removed; everything else stays."""
+        audio_dir = db.db_path.parent / "audio"
+        audio_dir.mkdir()
+        rows = []
+        for i, name in enumerate(audio_names):
+            if name is None:
+                rows.append((f"entry {i}",))
+            else:
+                (audio_dir / f"{name}.wav").write_bytes(b"RIFF")
+                rows.append((f"entry {i}", f"audio/{name}.wav"))
+        ids = db.add_history_bulk(rows)
+        to_delete = [ids[i] for i in delete_indexes]
+
+        deleted = db.delete_history_bulk(to_delete + extra_ids)
+
+        kept = [i for i in range(len(ids)) if i not in delete_indexes]
+        assert deleted == len(delete_indexes)
+        assert set(db.get_history_entries(ids)) == {ids[i] for i in kept}
+        remaining_files = {path.stem for path in audio_dir.iterdir()}
+        assert remaining_files == {audio_names[i] for i in kept if audio_names[i]}
+
+    def test_delete_history_bulk_rolls_back_on_error(self, db):
+        """A failing delete leaves all rows and audio files in place."""
+        audio_dir = db.db_path.parent / "audio"
+        audio_dir.mkdir()
+        (audio_dir / "a.wav").write_bytes(b"RIFF")
+        ids = db.add_history_bulk([("one", "audio/a.wav"), ("two",)])
+
+        conn = sqlite3.connect(db.db_path)
+        conn.execute(
+            f"CREATE TRIGGER fail_delete BEFORE DELETE ON history WHEN OLD.id = {ids[1]} "
+            "BEGIN SELECT RAISE(ABORT, 'simulated failure'); END"
+        )
+        conn.commit()
+        try:
+            # One id per chunk, so the first DELETE succeeds before the second fails
+            with patch("services.database._MAX_IN_PARAMS", 1):
+                with pytest.raises(sqlite3.IntegrityError):
+                    db.delete_history_bulk(ids)
+        finally:
+            conn.execute("DROP TRIGGER fail_delete")
+            conn.commit()
+            conn.close()
+
+        assert set(db.get_history_entries(ids)) == set(ids)
+        assert (audio_dir / "a.wav").exists()
+
+
+class TestAudioCleanup:
+    def test_clear_old_history_deletes_audio_files(self, db):
+        """Old entries' audio files are removed; paths outside the audio dir are left alone."""
+        audio_dir = db.db_path.parent / "audio"
+        audio_dir.mkdir()
+        old_audio = audio_dir / "old.wav"
+        kept_audio = audio_dir / "kept.wav"
+        outside = db.db_path.parent / "outside.wav"
+        for path in (old_audio, kept_audio, outside):
+            path.write_bytes(b"RIFF")
+
+        old_id, escaped_id, _ = db.add_history_bulk([
+            ("old", "audio/old.wav"),
+            ("escaped", "outside.wav"),
+            ("recent", "audio/kept.wav"),
+        ])
+        conn = sqlite3.connect(db.db_path)
+        conn.execute(
+            "UPDATE history SET created_at = '2000-01-01T00:00:00' WHERE id IN (?, ?)",
+            (old_id, escaped_id),
+        )
+        conn.commit()
+        conn.close()
+
+        db.clear_old_history(7)
+
+        assert not old_audio.exists()
+        assert kept_audio.exists()
+        assert outside.exists()
+        assert [entry["text"] for entry in db.get_history()] == ["recent"]
+
+    def test_delete_audio_files_ignores_missing(self, db):
+        """Missing files do not stop the remaining deletions."""
+        audio_dir = db.db_path.parent / "audio"
+        audio_dir.mkdir()
+        present = audio_dir / "present.wav"
+        present.write_bytes(b"RIFF")
+
+        db._delete_audio_files(["audio/missing.wav", "audio/present.wav"])
+
+        assert not present.exists()
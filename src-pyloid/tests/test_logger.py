@@ -10,50 +10,84 @@ Design requirements:
 """
 import pytest
 from pathlib import Path
-import tempfile
 import json
 import re
+import logging
 from unittest.mock import patch
 
+from services.logger import (
+    LOG_BACKUP_COUNT,
+    LOG_MAX_BYTES,
+    VALID_DOMAINS,
+    get_default_log_path,
+    get_logger,
+    reset_logging,
+    setup_logging,
+)
 
-@pytest.fixture(autouse=True)
+# [2025-12-17 14:32:01] [INFO] [model] Loading whisper-small
+_FORMAT_RE = re.compile(
+    r'\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[INFO\] \[model\] Loading whisper-small'
+)
+# ... | {"error":"Network timeout","url":"https://..."}
+_STRUCTURED_RE = re.compile(r'\| ({.+})')
+
+
+def _tail(path: Path, n: int = 4096) -> str:
+    """Read the last n bytes of a log file, however large it has grown."""
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        f.seek(max(0, f.tell() - n))
+        return f.read().decode("utf-8", "replace")
+
+
+@pytest.fixture
 def reset_logger_state():
-    """Reset logger state before and after each test."""
-    from services.logger import reset_logging
+    """Reset logger state before and after a test that writes log files.
+
+    Pulled in by temp_log_dir; tests that never log don't pay for it.
+    """
     reset_logging()
     yield
     reset_logging()
 
 
+@pytest.fixture(scope="module")
+def _module_log_root(tmp_path_factory):
+    """One base directory for every test's logs in this module."""
+    return tmp_path_factory.mktemp("vflogs")
+
+
 @pytest.fixture
-def temp_log_dir(reset_logger_state):
-    """Create a temporary directory for log files.
+def temp_log_dir(reset_logger_state, _module_log_root, request):
+    """Per-test log directory under the module's shared base directory.
 
-    This fixture depends on reset_logger_state to ensure proper cleanup order:
-    1. Test runs
-    2. reset_logging() closes file handles
-    3. temp_log_dir cleanup deletes files
+    Depends on reset_logger_state so file handles are closed after the test.
+    Directories are left for pytest's tmp_path retention to clean up, which
+    avoids a create/rmtree cycle per test (and Windows file-lock retries).
     """
-    from services.logger import reset_logging
-    tmpdir = tempfile.mkdtemp()
-    yield Path(tmpdir)
-    # Close file handles before cleanup
+    log_dir = _module_log_root / request.node.name
+    log_dir.mkdir()
+    yield log_dir
+    # Close file handles before pytest's tmp cleanup touches the files
     reset_logging()
-    # Clean up manually
-    import shutil
-    try:
-        shutil.rmtree(tmpdir)
-    except Exception:
-        pass  # Best effort cleanup on Windows
 
 
+@pytest.fixture(scope="class")
+def _class_logging(tmp_path_factory):
+    """Log to one temporary file for a whole class of file-less tests."""
+    reset_logging()
+    setup_logging(tmp_path_factory.mktemp("vflogs") / "VoiceFlow.log")
+    yield
+    reset_logging()
+
+
+@pytest.mark.usefixtures("_class_logging")
 class TestGetLogger:
     """Tests for get_logger() function."""
 
     def test_get_logger_returns_domain_logger(self):
         """get_logger('model') returns a logger for the model domain."""
-        from services.logger import get_logger
-
         log = get_logger("model")
 
         assert log is not None
@@ -64,8 +98,6 @@ class TestGetLogger:
 
     def test_get_logger_same_domain_returns_same_instance(self):
         """Calling get_logger with same domain returns same logger instance."""
-        from services.logger import get_logger
-
         log1 = get_logger("model")
         log2 = get_logger("model")
 
@@ -73,8 +105,6 @@ class TestGetLogger:
 
     def test_get_logger_different_domains_return_different_instances(self):
         """Different domains return different logger instances."""
-        from services.logger import get_logger
-
         model_log = get_logger("model")
         audio_log = get_logger("audio")
 
@@ -83,8 +113,6 @@ class TestGetLogger:
 
     def test_all_domains_are_valid(self):
         """All specified domains can be used."""
-        from services.logger import get_logger, VALID_DOMAINS
-
         # Design specifies these domains
         expected_domains = {"model", "audio", "hotkey", "settings", "database", "clipboard", "window"}
 
@@ -101,8 +129,6 @@ class TestLogFormat:
 
     def test_basic_log_format(self, temp_log_dir):
         """Log messages follow hybrid format: [timestamp] [LEVEL] [domain] message"""
-        from services.logger import get_logger, setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
@@ -110,23 +136,19 @@ class TestLogFormat:
         log.info("Loading whisper-small")
 
         # Read log file
-        content = log_file.read_text()
+        content = _tail(log_file)
 
-        # Check format: [2025-12-17 14:32:01] [INFO] [model] Loading whisper-small
-        pattern = r'\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[INFO\] \[model\] Loading whisper-small'
-        assert re.search(pattern, content), f"Expected format not found in: {content}"
+        assert _FORMAT_RE.search(content), f"Expected format not found in: {content}"
 
     def test_log_with_structured_data(self, temp_log_dir):
         """Log with kwargs includes structured JSON data after pipe."""
-        from services.logger import get_logger, setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
         log = get_logger("model")
         log.error("Download failed", error="Network timeout", url="https://example.com")
 
-        content = log_file.read_text()
+        content = _tail(log_file)
 
         # Check format: [timestamp] [ERROR] [model] Download failed | {"error":"Network timeout","url":"https://..."}
         assert "[ERROR]" in content
@@ -135,7 +157,7 @@ class TestLogFormat:
         assert "|" in content
 
         # Extract JSON part and verify it's valid
-        match = re.search(r'\| ({.+})', content)
+        match = _STRUCTURED_RE.search(content)
         assert match, f"Structured data not found in: {content}"
 
         data = json.loads(match.group(1))
@@ -144,15 +166,13 @@ class TestLogFormat:
 
     def test_log_without_structured_data_has_no_pipe(self, temp_log_dir):
         """Log without kwargs does not include pipe separator."""
-        from services.logger import get_logger, setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
         log = get_logger("model")
         log.info("Simple message")
 
-        content = log_file.read_text()
+        content = _tail(log_file)
         lines = [l for l in content.strip().split('\n') if 'Simple message' in l]
         assert len(lines) == 1
 
@@ -161,8 +181,6 @@ class TestLogFormat:
 
     def test_all_log_levels(self, temp_log_dir):
         """All log levels work correctly."""
-        from services.logger import get_logger, setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
@@ -172,26 +190,34 @@ class TestLogFormat:
         log.warning("Warning message")
         log.error("Error message")
 
-        content = log_file.read_text()
+        content = _tail(log_file)
 
         assert "[DEBUG]" in content
         assert "[INFO]" in content
         assert "[WARN]" in content  # Design uses WARN not WARNING
         assert "[ERROR]" in content
 
+    def test_structured_data_without_orjson(self, temp_log_dir):
+        """Structured data is still valid JSON when orjson is unavailable."""
+        log_file = temp_log_dir / "VoiceFlow.log"
+        setup_logging(log_file)
+
+        with patch("services.logger.orjson", None):
+            get_logger("model").info("Fallback", text="héllo", count=3)
+
+        match = _STRUCTURED_RE.search(log_file.read_text(encoding="utf-8"))
+        assert json.loads(match.group(1)) == {"text": "héllo", "count": 3}
+
 
 class TestLogRotation:
     """Tests for log file rotation."""
 
     def test_log_file_location(self, temp_log_dir):
         """Log file is created at specified location."""
-        from services.logger import setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
         # Write something to ensure file is created
-        from services.logger import get_logger
         log = get_logger("model")
         log.info("Test")
 
@@ -199,21 +225,15 @@ class TestLogRotation:
 
     def test_rotation_max_bytes_is_100mb(self):
         """Rotation is configured for 100MB max size."""
-        from services.logger import LOG_MAX_BYTES
-
         expected = 100 * 1024 * 1024  # 100MB
         assert LOG_MAX_BYTES == expected
 
     def test_rotation_keeps_one_backup(self):
         """Rotation keeps exactly 1 backup file."""
-        from services.logger import LOG_BACKUP_COUNT
-
         assert LOG_BACKUP_COUNT == 1
 
     def test_rotation_creates_backup_file(self, temp_log_dir):
         """When log exceeds max size, backup is created with .log.1 extension."""
-        from services.logger import setup_logging, get_logger
-
         log_file = temp_log_dir / "VoiceFlow.log"
         # Use small max size for testing
         setup_logging(log_file, max_bytes=1000, backup_count=1)
@@ -228,79 +248,91 @@ class TestLogRotation:
         backup_file = temp_log_dir / "VoiceFlow.log.1"
         assert backup_file.exists(), "Backup file should be created after rotation"
 
+    def test_rotation_counts_existing_file_size(self, temp_log_dir):
+        """Rotation accounts for content already in the log file when it is opened."""
+        log_file = temp_log_dir / "VoiceFlow.log"
+        log_file.write_text("x" * 900, encoding="utf-8")
+        setup_logging(log_file, max_bytes=1000, backup_count=1)
 
-class TestDefaultLogPath:
-    """Tests for default log file path."""
-
-    def test_default_log_path_is_in_voiceflow_dir(self):
-        """Default log path is ~/.VoiceFlow/VoiceFlow.log"""
-        from services.logger import get_default_log_path
-
-        expected = Path.home() / ".VoiceFlow" / "VoiceFlow.log"
-        assert get_default_log_path() == expected
-
-
-class TestDomainLoggerInterface:
-    """Tests for the DomainLogger interface."""
+        get_logger("model").info("y" * 200)
 
-    def test_info_with_kwargs(self, temp_log_dir):
-        """info() accepts keyword arguments for structured data."""
-        from services.logger import get_logger, setup_logging
+        backup_file = temp_log_dir / "VoiceFlow.log.1"
+        assert backup_file.read_text(encoding="utf-8") == "x" * 900
+        assert "y" * 200 in log_file.read_text(encoding="utf-8")
 
+    def test_rotation_count_matches_bytes_on_disk(self, temp_log_dir):
+        """The in-process byte count matches the file, newline translation included."""
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
         log = get_logger("model")
-        log.info("Model loaded", model_name="small", load_time_ms=1234)
+        log.info("first line")
+        log.error("multi\nline\nmessage", detail="é")
 
-        content = log_file.read_text()
-        assert "model_name" in content
-        assert "small" in content
-        assert "load_time_ms" in content
-        assert "1234" in content
+        handler = next(
+            h for h in logging.getLogger("VoiceFlow").handlers
+            if isinstance(h, logging.FileHandler)
+        )
+        assert handler._bytes_written == log_file.stat().st_size
 
-    def test_error_with_kwargs(self, temp_log_dir):
-        """error() accepts keyword arguments for structured data."""
-        from services.logger import get_logger, setup_logging
 
-        log_file = temp_log_dir / "VoiceFlow.log"
-        setup_logging(log_file)
+class TestDefaultLogPath:
+    """Tests for default log file path."""
 
-        log = get_logger("audio")
-        log.error("Recording failed", device_id=2, error_code="ACCESS_DENIED")
+    def test_default_log_path_is_in_voiceflow_dir(self):
+        """Default log path is ~/.VoiceFlow/VoiceFlow.log"""
+        expected = Path.home() / ".VoiceFlow" / "VoiceFlow.log"
+        assert get_default_log_path() == expected
 
-        content = log_file.read_text()
-        assert "device_id" in content
-        assert "error_code" in content
-        assert "ACCESS_DENIED" in content
 
-    def test_debug_with_kwargs(self, temp_log_dir):
-        """debug() accepts keyword arguments for structured data."""
-        from services.logger import get_logger, setup_logging
+class TestDomainLoggerInterface:
+    """Tests for the DomainLogger interface."""
 
+    @pytest.mark.parametrize(
+        "level, domain, message, kwargs, needles",
+        [
+            ("info", "model", "Model loaded", {"model_name": "small", "load_time_ms": 1234},
+             ["model_name", "small", "load_time_ms", "1234"]),
+            ("error", "audio", "Recording failed", {"device_id": 2, "error_code": "ACCESS_DENIED"},
+             ["device_id", "error_code", "ACCESS_DENIED"]),
+            ("debug", "hotkey", "Key pressed", {"key": "ctrl", "state": "down"},
+             ["key", "ctrl"]),
+            ("warning", "settings", "Invalid value", {"setting": "retention", "value": -5},
+             ["setting", "retention"]),
+        ],
+    )
+    def test_level_with_kwargs(self, temp_log_dir, level, domain, message, kwargs, needles):
+        """Every level method accepts keyword arguments for structured data."""
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
-        log = get_logger("hotkey")
-        log.debug("Key pressed", key="ctrl", state="down")
+        getattr(get_logger(domain), level)(message, **kwargs)
 
         content = log_file.read_text()
-        assert "key" in content
-        assert "ctrl" in content
-
-    def test_warning_with_kwargs(self, temp_log_dir):
-        """warning() accepts keyword arguments for structured data."""
-        from services.logger import get_logger, setup_logging
+        for needle in needles:
+            assert needle in content
 
+    def test_is_enabled_for_follows_logger_level(self, temp_log_dir):
+        """is_enabled_for() reflects the level, and disabled messages are not written."""
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
-        log = get_logger("settings")
-        log.warning("Invalid value", setting="retention", value=-5)
+        log = get_logger("model")
+        assert log.is_enabled_for(logging.DEBUG)
+
+        # The underlying logger is process-global, so put its level back
+        previous_level = log._logger.level
+        log._logger.setLevel(logging.INFO)
+        try:
+            assert not log.is_enabled_for(logging.DEBUG)
+            log.debug("Hidden debug", value=1)
+            log.info("Visible info")
+        finally:
+            log._logger.setLevel(previous_level)
 
         content = log_file.read_text()
-        assert "setting" in content
-        assert "retention" in content
+        assert "Hidden debug" not in content
+        assert "Visible info" in content
 
 
 class TestLoggerReset:
@@ -308,8 +340,6 @@ class TestLoggerReset:
 
     def test_reset_logging_clears_state(self, temp_log_dir):
         """reset_logging() clears all logger state for test isolation."""
-        from services.logger import get_logger, reset_logging, setup_logging
-
         log_file = temp_log_dir / "VoiceFlow.log"
         setup_logging(log_file)
 
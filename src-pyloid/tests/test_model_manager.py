@@ -16,6 +16,7 @@ Data classes:
 import pytest
 from dataclasses import dataclass
 from unittest.mock import Mock, patch, MagicMock
+from pathlib import Path
 from typing import Callable, Optional
 
 
@@ -50,6 +51,19 @@ class TestCancelToken:
 
         assert token.is_cancelled() is True
 
+    def test_cancel_wakes_waiters(self):
+        """cancel() sets events registered with _add_waiter()."""
+        import threading
+        from services.model_manager import CancelToken
+
+        token = CancelToken()
+        event = threading.Event()
+        token._add_waiter(event)
+
+        assert not event.is_set()
+        token.cancel()
+        assert event.is_set()
+
 
 class TestModelInfo:
     """Tests for ModelInfo dataclass."""
@@ -146,6 +160,12 @@ class TestModelManager:
         from services.model_manager import ModelManager
         return ModelManager()
 
+    @pytest.fixture
+    def patched_download(self, model_manager):
+        """Replace _do_download so no test touches the network."""
+        with patch.object(model_manager, '_do_download') as mock_download:
+            yield mock_download
+
     def test_is_model_cached_returns_false_for_uncached_model(self, model_manager):
         """is_model_cached returns False when model is not in cache."""
         # Use a fake model name that can't possibly be cached
@@ -170,7 +190,84 @@ class TestModelManager:
         assert isinstance(info.cached, bool)
         # The actual value depends on whether tiny was downloaded before
 
-    def test_download_model_accepts_progress_callback(self, model_manager):
+    def test_get_cache_path_is_resolved_once(self, model_manager):
+        """get_cache_path returns the same hub cache directory on every call."""
+        path = model_manager.get_cache_path()
+
+        assert isinstance(path, Path)
+        assert model_manager.get_cache_path() is path
+
+    def test_is_model_cached_reuses_verified_result(self, model_manager, tmp_path):
+        """A verified model is rechecked with a stat until its folder disappears."""
+        model_manager._cache_root = tmp_path
+        repo_dir = tmp_path / "models--Systran--faster-whisper-tiny"
+        repo_dir.mkdir()
+
+        with patch("huggingface_hub.snapshot_download") as mock_snapshot:
+            assert model_manager.is_model_cached("tiny") is True
+            assert model_manager.is_model_cached("tiny") is True
+            assert mock_snapshot.call_count == 1
+
+            repo_dir.rmdir()
+            mock_snapshot.side_effect = FileNotFoundError
+            assert model_manager.is_model_cached("tiny") is False
+            assert mock_snapshot.call_count == 2
+
+    def test_clear_cache_deletes_snapshot_tree(self, model_manager, tmp_path):
+        """clear_cache removes a HF repo tree, counting blob bytes once and never following links."""
+        cache = tmp_path / "hub"
+        repo = cache / "models--Systran--faster-whisper-tiny"
+        (repo / "blobs").mkdir(parents=True)
+        (repo / "blobs" / "abc123").write_bytes(b"x" * 1000)
+        (repo / "blobs" / "def456").write_bytes(b"y" * 24)
+        snapshot = repo / "snapshots" / "rev1"
+        snapshot.mkdir(parents=True)
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        try:
+            (snapshot / "model.bin").symlink_to(repo / "blobs" / "abc123")
+            (snapshot / "config.json").symlink_to(repo / "blobs" / "def456")
+            (snapshot / "linked_dir").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported here")
+        model_manager._cache_root = cache
+
+        result = model_manager.clear_cache()
+
+        assert result["success"] is True
+        assert result["deleted_models"] == ["tiny"]
+        assert result["deleted_bytes"] == 1024
+        assert not repo.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_clear_cache_leaves_unrelated_repos(self, model_manager, tmp_path):
+        """clear_cache only deletes faster-whisper repos, not other models in the hub cache."""
+        (tmp_path / "models--Systran--faster-whisper-base" / "blobs").mkdir(parents=True)
+        other = tmp_path / "models--bert-base-uncased"
+        (other / "blobs").mkdir(parents=True)
+        (other / "blobs" / "weights").write_bytes(b"z" * 10)
+        (tmp_path / "datasets--squad").mkdir()
+        model_manager._cache_root = tmp_path
+
+        result = model_manager.clear_cache()
+
+        assert result["deleted_models"] == ["base"]
+        assert not (tmp_path / "models--Systran--faster-whisper-base").exists()
+        assert (other / "blobs" / "weights").exists()
+        assert (tmp_path / "datasets--squad").exists()
+
+    def test_clear_cache_without_model_repos(self, model_manager, tmp_path):
+        """A hub cache with no models-- entries clears nothing and succeeds."""
+        (tmp_path / "datasets--squad").mkdir()
+        model_manager._cache_root = tmp_path
+
+        result = model_manager.clear_cache()
+
+        assert result == {"success": True, "deleted_bytes": 0, "deleted_models": [], "error": None}
+        assert (tmp_path / "datasets--squad").exists()
+
+    def test_download_model_accepts_progress_callback(self, model_manager, patched_download):
         """download_model accepts an on_progress callback."""
         from services.model_manager import CancelToken, DownloadProgress
 
@@ -182,50 +279,47 @@ class TestModelManager:
         token = CancelToken()
 
         # This test just verifies the signature, not actual download
-        # We'll use a mock to avoid actual downloads in unit tests
-        with patch.object(model_manager, '_do_download') as mock_download:
-            mock_download.return_value = True
-            model_manager.download_model("tiny", on_progress, token)
+        patched_download.return_value = True
+        model_manager.download_model("tiny", on_progress, token)
 
-            # Verify _do_download was called with correct args
-            mock_download.assert_called_once()
+        # Verify _do_download was called with correct args
+        patched_download.assert_called_once()
 
-    def test_download_model_respects_cancellation(self, model_manager):
+    def test_download_model_respects_cancellation(self, model_manager, patched_download):
         """download_model returns False when cancelled."""
         from services.model_manager import CancelToken
 
         token = CancelToken()
         token.cancel()  # Cancel immediately
 
-        with patch.object(model_manager, '_do_download') as mock_download:
-            # Should not even call _do_download if already cancelled
-            result = model_manager.download_model("tiny", lambda p: None, token)
+        # Should not even call _do_download if already cancelled
+        result = model_manager.download_model("tiny", lambda p: None, token)
 
-            assert result is False
-            mock_download.assert_not_called()
+        assert result is False
+        patched_download.assert_not_called()
 
-    def test_download_model_returns_true_on_success(self, model_manager):
+    def test_download_model_returns_true_on_success(self, model_manager, patched_download):
         """download_model returns True when download completes successfully."""
         from services.model_manager import CancelToken
 
         token = CancelToken()
 
-        with patch.object(model_manager, '_do_download', return_value=True):
-            result = model_manager.download_model("tiny", lambda p: None, token)
+        patched_download.return_value = True
+        result = model_manager.download_model("tiny", lambda p: None, token)
 
-            assert result is True
+        assert result is True
 
-    def test_download_model_returns_false_on_cancel(self, model_manager):
+    def test_download_model_returns_false_on_cancel(self, model_manager, patched_download):
         """download_model returns False when cancelled during download."""
         from services.model_manager import CancelToken
 
         token = CancelToken()
 
         # Simulate cancellation during download
-        with patch.object(model_manager, '_do_download', return_value=False):
-            result = model_manager.download_model("tiny", lambda p: None, token)
+        patched_download.return_value = False
+        result = model_manager.download_model("tiny", lambda p: None, token)
 
-            assert result is False
+        assert result is False
 
 
 class TestModelManagerIntegration:
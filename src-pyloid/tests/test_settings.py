@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
 import tempfile
+from unittest.mock import patch
 from services.database import DatabaseService
 from services.settings import SettingsService, Settings, WHISPER_MODELS, WHISPER_LANGUAGES
 
@@ -86,6 +87,38 @@ class TestSettingsService:
         assert settings.model == "small"
         assert settings.theme == "light"
 
+    def test_update_patches_cached_settings(self, settings_service):
+        """Updating settings patches the cache instead of reloading from the database."""
+        cached = settings_service.get_settings()
+
+        with patch.object(settings_service.db, "get_settings_bulk") as mock_bulk:
+            settings = settings_service.update_settings(theme="dark", retention=7)
+
+        mock_bulk.assert_not_called()
+        assert settings is cached
+        assert settings.theme == "dark"
+        assert settings.retention == 7
+
+    def test_invalidate_cache_reloads_from_database(self, settings_service, db):
+        """invalidate_cache() makes the next get_settings() read the database again."""
+        settings_service.get_settings()
+        db.set_setting("theme", "light")
+
+        assert settings_service.get_settings().theme == "system"
+        settings_service.invalidate_cache()
+        assert settings_service.get_settings().theme == "light"
+
+    def test_update_multiple_settings_writes_once(self, settings_service):
+        """Updating several settings writes them in a single bulk call."""
+        with patch.object(settings_service.db, "set_settings_bulk") as mock_bulk:
+            settings_service.update_settings(language="de", auto_start=False, microphone=3)
+
+        mock_bulk.assert_called_once_with([
+            ("language", "de"),
+            ("auto_start", "false"),
+            ("microphone", "3"),
+        ])
+
     def test_settings_persist_across_instances(self, db):
         """Settings persist when creating new service instance."""
         service1 = SettingsService(db)
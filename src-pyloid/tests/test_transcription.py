@@ -1,5 +1,8 @@
 import pytest
+import threading
 import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch
 from services.transcription import TranscriptionService
 
 
@@ -83,6 +86,25 @@ class TestTranscriptionService:
         result = service.transcribe(audio)
         assert isinstance(result, str)
 
+    def test_transcribe_does_not_modify_caller_audio(self):
+        """Normalization writes into a pooled buffer, not the caller's array."""
+        service = TranscriptionService()
+        seen = []
+
+        def fake_transcribe(audio, **kwargs):
+            seen.append(float(np.abs(audio).max()))
+            return iter([SimpleNamespace(text=" hi")]), None
+
+        service._model = SimpleNamespace(transcribe=fake_transcribe)
+        audio = np.array([2.0, -4.0, 1.0] * 4000, dtype=np.float32)
+        original = audio.copy()
+
+        assert service.transcribe(audio) == "hi"
+        assert service.transcribe(audio) == "hi"
+        assert seen == [1.0, 1.0]
+        np.testing.assert_array_equal(audio, original)
+        assert len(service._scratch_pool) == 1
+
     def test_transcribe_with_language_specified(self):
         """Can transcribe with specific language."""
         service = TranscriptionService()
@@ -104,3 +126,122 @@ class TestTranscriptionService:
         # Should not raise
         result = service.transcribe(audio, language="auto")
         assert isinstance(result, str)
+
+    def test_switching_back_reuses_pooled_model(self):
+        """Recently used models are kept and reused instead of reloaded."""
+        service = TranscriptionService()
+        with patch("faster_whisper.WhisperModel") as whisper_model:
+            whisper_model.side_effect = lambda *args, **kwargs: object()
+            service.load_model("tiny", "cpu")
+            tiny = service._model
+            service.load_model("base", "cpu")
+            service.load_model("tiny", "cpu")
+            assert service._model is tiny
+            assert whisper_model.call_count == 2
+
+            # A third model evicts the least recently used one (base)
+            service.load_model("small", "cpu")
+            service.load_model("base", "cpu")
+            assert whisper_model.call_count == 4
+
+    def test_full_pool_evicts_before_constructing(self):
+        """A full pool makes room before the next model is built, not after."""
+        service = TranscriptionService()
+        resident = []
+
+        def build(*args, **kwargs):
+            resident.append(len(service._model_pool))
+            return object()
+
+        with patch("faster_whisper.WhisperModel", side_effect=build):
+            for name in ("tiny", "base", "small"):
+                service.load_model(name, "cpu")
+
+        assert resident == [0, 1, 1]
+        assert [key[0] for key in service._model_pool] == ["base", "small"]
+
+    def test_reload_follows_device_resolution(self):
+        """Re-requesting "auto" reloads once the resolved device changes."""
+        service = TranscriptionService()
+        with patch("faster_whisper.WhisperModel") as whisper_model, \
+                patch("services.transcription.get_compute_type", return_value="int8"), \
+                patch("services.transcription.resolve_device", side_effect=["cpu", "cpu", "cuda"]):
+            service.load_model("tiny", "auto")
+            service.load_model("tiny", "auto")
+            assert whisper_model.call_count == 1
+
+            # e.g. cuDNN was installed and the CUDA cache reset
+            service.load_model("tiny", "auto")
+            assert whisper_model.call_count == 2
+            assert service.get_current_device() == "cuda"
+
+    def test_transcribe_waits_for_model_being_loaded(self):
+        """transcribe() called mid-load waits for the model instead of raising."""
+        service = TranscriptionService()
+        constructing = threading.Event()
+        release = threading.Event()
+
+        def slow_model(*args, **kwargs):
+            constructing.set()
+            release.wait(5)
+            return SimpleNamespace(
+                transcribe=lambda audio, **kw: (iter([SimpleNamespace(text=" ready")]), None)
+            )
+
+        results = []
+        with patch("faster_whisper.WhisperModel", side_effect=slow_model):
+            loader = threading.Thread(target=service.load_model, args=("tiny", "cpu"))
+            loader.start()
+            assert constructing.wait(5)
+
+            # Status getters answer while the model is being constructed
+            assert service.is_loading()
+            assert service.get_current_model() is None
+
+            caller = threading.Thread(
+                target=lambda: results.append(service.transcribe(np.zeros(1600, dtype=np.float32)))
+            )
+            caller.start()
+            release.set()
+            loader.join(5)
+            caller.join(5)
+
+        assert results == ["ready"]
+
+    def test_transcribe_fails_fast_when_load_fails(self):
+        """A failed load wakes a waiting transcribe() instead of leaving it blocked."""
+        service = TranscriptionService()
+        constructing = threading.Event()
+        release = threading.Event()
+
+        def broken_model(*args, **kwargs):
+            constructing.set()
+            release.wait(5)
+            raise RuntimeError("model files missing")
+
+        errors = []
+
+        def load():
+            with pytest.raises(RuntimeError, match="model files missing"):
+                service.load_model("tiny", "cpu")
+
+        def call_transcribe():
+            try:
+                service.transcribe(np.zeros(1600, dtype=np.float32))
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        with patch("faster_whisper.WhisperModel", side_effect=broken_model):
+            loader = threading.Thread(target=load)
+            loader.start()
+            assert constructing.wait(5)
+
+            caller = threading.Thread(target=call_transcribe)
+            caller.start()
+            release.set()
+            loader.join(5)
+            caller.join(5)
+
+        assert not caller.is_alive()
+        assert not service.is_loading()
+        assert errors == ["Model not loaded. Call load_model() first."]